@@ -0,0 +1,26 @@
+"""add rating aggregate index
+
+Revision ID: 3f8a1c6d42be
+Revises: 7c41d2b90a8e
+Create Date: 2026-08-29 14:37:05.481203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f8a1c6d42be'
+down_revision: Union[str, None] = '7c41d2b90a8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    # covers avg(score)/count GROUP BY movie_id with an index-only scan
+    op.create_index("ix_mr_movie_score", "movie_ratings", ["movie_id", "score"])
+
+
+def downgrade():
+    op.drop_index("ix_mr_movie_score", table_name="movie_ratings")
@@ -0,0 +1,39 @@
+"""add movie list indexes
+
+Revision ID: 7c41d2b90a8e
+Revises: 619f6075e35b
+Create Date: 2026-08-29 09:12:41.002318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7c41d2b90a8e'
+down_revision: Union[str, None] = '619f6075e35b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index("ix_movies_release_year", "movies", ["release_year"])
+    op.create_index(
+        "ix_movies_title_trgm",
+        "movies",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index("ix_movies_year_id", "movies", ["release_year", "id"])
+    op.create_index("ix_movie_genres_genre_movie", "movie_genres", ["genre_id", "movie_id"])
+
+
+def downgrade():
+    op.drop_index("ix_movie_genres_genre_movie", table_name="movie_genres")
+    op.drop_index("ix_movies_year_id", table_name="movies")
+    op.drop_index("ix_movies_title_trgm", table_name="movies")
+    op.drop_index("ix_movies_release_year", table_name="movies")
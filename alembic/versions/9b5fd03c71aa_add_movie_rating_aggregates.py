@@ -0,0 +1,43 @@
+"""add movie rating aggregate columns
+
+Revision ID: 9b5fd03c71aa
+Revises: 3f8a1c6d42be
+Create Date: 2026-08-29 16:02:18.930447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9b5fd03c71aa'
+down_revision: Union[str, None] = '3f8a1c6d42be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.add_column("movies", sa.Column("avg_rating", sa.Float(), nullable=True))
+    op.add_column(
+        "movies",
+        sa.Column("ratings_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # backfill from the existing ratings so reads are correct immediately
+    op.execute(
+        """
+        UPDATE movies m
+        SET avg_rating = s.avg, ratings_count = s.cnt
+        FROM (
+            SELECT movie_id, AVG(score)::float AS avg, COUNT(id) AS cnt
+            FROM movie_ratings
+            GROUP BY movie_id
+        ) s
+        WHERE s.movie_id = m.id
+        """
+    )
+
+
+def downgrade():
+    op.drop_column("movies", "ratings_count")
+    op.drop_column("movies", "avg_rating")
@@ -1,8 +1,11 @@
 from typing import Any, Optional
+import hashlib
+import json
 import logging
 import time
 
-from fastapi import APIRouter, Query, HTTPException, FastAPI, Path
+from fastapi import APIRouter, Depends, Query, HTTPException, FastAPI, Path, Request, Response
+from fastapi.responses import ORJSONResponse
 from starlette import status
 
 from app.api.schemas.base import ErrorResponse, ErrorDetail
@@ -18,201 +21,331 @@ from app.exceptions.exceptions import ValidationError, NotFoundError
 
 logger = logging.getLogger("movie_rating")
 
+router = APIRouter(prefix="/api/v1/movies", tags=["movies"])
 
-class MovieAPI:
-    """Movie API router holder."""
+_service: Any = None
 
-    def __init__(self, service: Any) -> None:
-        """Construct MovieAPI.
+
+def get_movie_service() -> Any:
+    """Return the wired MovieService instance.
+
+    Returns:
+        Any: MovieService instance.
+
+    Raises:
+        RuntimeError: if MovieAPI has not been constructed yet.
+    """
+    if _service is None:
+        raise RuntimeError("MovieService is not initialized; construct MovieAPI first")
+    return _service
+
+
+class _RouteTimer:
+    """Async context manager logging one timed line per request outcome.
+
+    Attributes:
+        result (Any): payload set by the handler for the success log.
+    """
+
+    def __init__(self, log: logging.Logger, operation: str, route: str, **fields: Any) -> None:
+        """Construct _RouteTimer.
 
         Args:
-            service (Any): MovieService instance.
+            log (logging.Logger): logger to emit to.
+            operation (str): human readable operation name.
+            route (str): route path for log context.
+            **fields (Any): extra request fields for log context.
 
         Returns:
             None: nothing.
+
+        Raises:
+            None: initializer.
         """
-        self._service = service
-        self.router = APIRouter(prefix="/api/v1/movies", tags=["movies"])
-        self._register_routes()
-
-    def _register_routes(self) -> None:
-        """Register router endpoints."""
-
-        @self.router.get(
-            "/",
-            response_model=MoviesListResponse,
-            responses={
-                422: {"model": ErrorResponse},
-                500: {"description": "Internal server error"},
-            },
-        )
-        async def list_movies(
-            page: int = Query(1, ge=1),
-            page_size: int = Query(10, ge=1),
-            title: Optional[str] = Query(None),
-            release_year: Optional[int] = Query(None),
-            genre: Optional[str] = Query(None),
-        ) -> MoviesListResponse:
-            """List movies with pagination and optional filters."""
-            route = "/api/v1/movies"
-            start = time.perf_counter()
-
-            logger.info(
-                "List movies requested (route=%s, page=%s, page_size=%s, title=%s, release_year=%s, genre=%s)",
-                route,
-                page,
-                page_size,
-                title,
-                release_year,
-                genre,
+        self._log = log
+        self._operation = operation
+        self._route = route
+        self._fields = fields
+        self._start = 0.0
+        self.result: Any = None
+
+    async def __aenter__(self) -> "_RouteTimer":
+        self._start = time.perf_counter()
+        if self._log.isEnabledFor(logging.INFO):
+            self._log.info(
+                "%s requested (route=%s, %s)",
+                self._operation,
+                self._route,
+                ", ".join(f"{k}={v}" for k, v in self._fields.items()),
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        duration_ms = int((time.perf_counter() - self._start) * 1000)
+        if exc_type is None:
+            returned = len(self.result.get("items", [])) if isinstance(self.result, dict) else None
+            total = self.result.get("total_items") if isinstance(self.result, dict) else None
+            self._log.info(
+                "%s success (route=%s, returned=%s, total_items=%s, duration_ms=%s)",
+                self._operation,
+                self._route,
+                returned,
+                total,
+                duration_ms,
+            )
+        elif isinstance(exc, HTTPException) and exc.status_code < 500:
+            self._log.warning(
+                "%s failed (route=%s, status=%s, duration_ms=%s)",
+                self._operation,
+                self._route,
+                exc.status_code,
+                duration_ms,
             )
+        else:
+            self._log.error(
+                "%s failed (route=%s, duration_ms=%s)",
+                self._operation,
+                self._route,
+                duration_ms,
+                exc_info=True,
+            )
+        return False
+
+
+def _error_detail(code: int, message: str) -> dict:
+    """Build an error-response dict without running Pydantic validation.
+
+    Args:
+        code (int): HTTP error code.
+        message (str): human readable message.
+
+    Returns:
+        dict: ErrorResponse-shaped payload for HTTPException detail.
+
+    Raises:
+        None: pure builder.
+    """
+    return ErrorResponse.model_construct(
+        status="failure",
+        error=ErrorDetail.model_construct(code=code, message=message),
+    ).model_dump()
 
-            try:
-                data = self._service.get_movies_paginated(
-                    page=page,
+
+@router.get(
+    "/",
+    response_model=None,
+    responses={
+        200: {"model": MoviesListResponse},
+        422: {"model": ErrorResponse},
+        500: {"description": "Internal server error"},
+    },
+)
+async def list_movies(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    title: Optional[str] = Query(None),
+    release_year: Optional[int] = Query(None),
+    genre: Optional[str] = Query(None),
+    after_id: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = Query(None),
+    with_total: bool = Query(False),
+    service: Any = Depends(get_movie_service),
+) -> ORJSONResponse:
+    """List movies with pagination and optional filters.
+
+    With ``cursor`` the page is fetched by keyset scan and carries
+    ``has_more``/``next_cursor`` instead of ``total_items``; otherwise the
+    offset API applies, with ``after_id`` kept as a compatibility shim.
+    """
+    route = "/api/v1/movies"
+
+    async with _RouteTimer(
+        logger,
+        "List movies",
+        route,
+        page=page,
+        page_size=page_size,
+        title=title,
+        release_year=release_year,
+        genre=genre,
+    ) as timer:
+        try:
+            if cursor is not None:
+                data = await service.get_movies_keyset(
+                    cursor,
                     page_size=page_size,
                     title=title,
                     release_year=release_year,
                     genre=genre,
                 )
+                timer.result = data
+                # the service already produced the response shape; skip the
+                # Pydantic re-validation pass and serialize once with orjson
+                return ORJSONResponse({"status": "success", "data": data})
 
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.info(
-                    "List movies success (route=%s, page=%s, page_size=%s, returned=%s, total_items=%s, duration_ms=%s)",
-                    route,
-                    page,
-                    page_size,
-                    len(data.get("items", [])),
-                    data.get("total_items"),
-                    duration_ms,
-                )
-                return MoviesListResponse(status="success", data=data)
-
-            except ValidationError as ve:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.warning(
-                    "List movies validation failed (route=%s, duration_ms=%s, error=%s)",
-                    route,
-                    duration_ms,
-                    str(ve),
-                )
-                error_detail = ErrorDetail(code=422, message=str(ve))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=422, detail=error_response.model_dump())
-
-            except Exception as ex:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.error(
-                    "List movies failed (route=%s, duration_ms=%s)",
-                    route,
-                    duration_ms,
-                    exc_info=True,
-                )
-                raise HTTPException(status_code=500, detail=str(ex))
-
-        @self.router.get(
-            "/{movie_id}",
-            response_model=MovieDetailResponse,
-            responses={
-                404: {"model": ErrorResponse},
-                422: {"model": ErrorResponse},
-                500: {"description": "Internal server error"},
-            },
-        )
-        async def get_movie(movie_id: int = Path(..., gt=0)) -> MovieDetailResponse:
-            """Get detailed movie by id."""
-            try:
-                data = self._service.get_movie_detail(movie_id)
-                return MovieDetailResponse(status="success", data=data)
-            except NotFoundError as nf:
-                error_detail = ErrorDetail(code=404, message=str(nf))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=404, detail=error_response.model_dump())
-            except ValidationError as ve:
-                error_detail = ErrorDetail(code=422, message=str(ve))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=422, detail=error_response.model_dump())
-            except Exception as ex:
-                raise HTTPException(status_code=500, detail=str(ex))
-
-        @self.router.post(
-            "/",
-            response_model=MovieCreateResponse,
-            status_code=status.HTTP_201_CREATED,
-            responses={
-                201: {"description": "Created"},
-                422: {"model": ErrorResponse},
-                500: {"description": "Internal server error"},
-            },
-        )
-        async def create_movie(body: MovieCreateRequest) -> MovieCreateResponse:
-            """Create a new movie."""
-            try:
-                data = self._service.create_movie(
-                    title=body.title,
-                    director_id=body.director_id,
-                    release_year=body.release_year,
-                    cast=body.cast,
-                    genre_ids=body.genres,
-                )
-                return MovieCreateResponse(status="success", data=data)
-            except ValidationError as ve:
-                error_detail = ErrorDetail(code=422, message=str(ve))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=422, detail=error_response.model_dump())
-            except Exception as ex:
-                raise HTTPException(status_code=500, detail=str(ex))
-
-        @self.router.put(
-            "/{movie_id}",
-            response_model=MovieUpdateResponse,
-            responses={
-                404: {"model": ErrorResponse},
-                422: {"model": ErrorResponse},
-                500: {"description": "Internal server error"},
-            },
+            # offset mode: the service caches the encoded body, so repeat
+            # hits skip serialization entirely
+            body, data = await service.get_movies_list_bytes(
+                page=page,
+                page_size=page_size,
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                after_id=after_id,
+                with_total=with_total,
+            )
+            timer.result = data
+            return Response(content=body, media_type="application/json")
+        except ValidationError as ve:
+            raise HTTPException(status_code=422, detail=_error_detail(422, str(ve)))
+        except HTTPException:
+            raise
+        except Exception as ex:
+            raise HTTPException(status_code=500, detail=str(ex))
+
+
+@router.get(
+    "/{movie_id}",
+    response_model=MovieDetailResponse,
+    responses={
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"description": "Internal server error"},
+    },
+)
+async def get_movie(
+    request: Request,
+    response: Response,
+    movie_id: int = Path(..., gt=0),
+    service: Any = Depends(get_movie_service),
+) -> MovieDetailResponse:
+    """Get detailed movie by id."""
+    try:
+        data = await service.get_movie_detail(movie_id)
+        etag = '"' + hashlib.md5(
+            json.dumps(data, sort_keys=True, default=str).encode()
+        ).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            # RFC 9110: a 304 carries the same validator headers as a 200
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+        return MovieDetailResponse(status="success", data=data)
+    except NotFoundError as nf:
+        raise HTTPException(status_code=404, detail=_error_detail(404, str(nf)))
+    except ValidationError as ve:
+        raise HTTPException(status_code=422, detail=_error_detail(422, str(ve)))
+    except Exception as ex:
+        raise HTTPException(status_code=500, detail=str(ex))
+
+
+@router.post(
+    "/",
+    response_model=MovieCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        201: {"description": "Created"},
+        422: {"model": ErrorResponse},
+        500: {"description": "Internal server error"},
+    },
+)
+async def create_movie(
+    body: MovieCreateRequest,
+    service: Any = Depends(get_movie_service),
+) -> MovieCreateResponse:
+    """Create a new movie."""
+    try:
+        data = await service.create_movie(
+            title=body.title,
+            director_id=body.director_id,
+            release_year=body.release_year,
+            cast=body.cast,
+            genre_ids=body.genres,
         )
-        async def update_movie(movie_id: int = Path(..., gt=0), body: MovieUpdateRequest = ...):
-            try:
-                data = self._service.update_movie(
-                    movie_id=movie_id,
-                    title=body.title,
-                    release_year=body.release_year,
-                    cast=body.cast,
-                    genre_ids=body.genres,
-                )
-                return MovieUpdateResponse(status="success", data=data)
-            except NotFoundError as nf:
-                error_detail = ErrorDetail(code=404, message=str(nf))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=404, detail=error_response.model_dump())
-            except ValidationError as ve:
-                error_detail = ErrorDetail(code=422, message=str(ve))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=422, detail=error_response.model_dump())
-            except Exception as ex:
-                raise HTTPException(status_code=500, detail=str(ex))
-
-        @self.router.delete(
-            "/{movie_id}",
-            status_code=status.HTTP_204_NO_CONTENT,
-            responses={
-                204: {"description": "No Content"},
-                404: {"model": ErrorResponse},
-                500: {"description": "Internal server error"},
-            },
+        return MovieCreateResponse(status="success", data=data)
+    except ValidationError as ve:
+        raise HTTPException(status_code=422, detail=_error_detail(422, str(ve)))
+    except Exception as ex:
+        raise HTTPException(status_code=500, detail=str(ex))
+
+
+@router.put(
+    "/{movie_id}",
+    response_model=MovieUpdateResponse,
+    responses={
+        404: {"model": ErrorResponse},
+        422: {"model": ErrorResponse},
+        500: {"description": "Internal server error"},
+    },
+)
+async def update_movie(
+    movie_id: int = Path(..., gt=0),
+    body: MovieUpdateRequest = ...,
+    service: Any = Depends(get_movie_service),
+):
+    try:
+        data = await service.update_movie(
+            movie_id=movie_id,
+            title=body.title,
+            release_year=body.release_year,
+            cast=body.cast,
+            genre_ids=body.genres,
         )
-        async def delete_movie(movie_id: int = Path(..., gt=0)):
-            try:
-                self._service.delete_movie(movie_id)
-                return  # FastAPI returns empty body for 204
-            except NotFoundError as nf:
-                error_detail = ErrorDetail(code=404, message=str(nf))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=404, detail=error_response.model_dump())
-            except Exception as ex:
-                raise HTTPException(status_code=500, detail=str(ex))
+        return MovieUpdateResponse(status="success", data=data)
+    except NotFoundError as nf:
+        raise HTTPException(status_code=404, detail=_error_detail(404, str(nf)))
+    except ValidationError as ve:
+        raise HTTPException(status_code=422, detail=_error_detail(422, str(ve)))
+    except Exception as ex:
+        raise HTTPException(status_code=500, detail=str(ex))
+
+
+@router.delete(
+    "/{movie_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    responses={
+        204: {"description": "No Content"},
+        404: {"model": ErrorResponse},
+        500: {"description": "Internal server error"},
+    },
+)
+async def delete_movie(
+    movie_id: int = Path(..., gt=0),
+    service: Any = Depends(get_movie_service),
+) -> Response:
+    try:
+        await service.delete_movie(movie_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except NotFoundError as nf:
+        raise HTTPException(status_code=404, detail=_error_detail(404, str(nf)))
+    except Exception as ex:
+        raise HTTPException(status_code=500, detail=str(ex))
+
+
+class MovieAPI:
+    """Movie API router holder.
+
+    Routes are declared once at module import; constructing MovieAPI only
+    wires the service instance the module-level handlers resolve through
+    Depends(get_movie_service).
+    """
+
+    def __init__(self, service: Any) -> None:
+        """Construct MovieAPI.
+
+        Args:
+            service (Any): MovieService instance.
+
+        Returns:
+            None: nothing.
+        """
+        global _service
+        _service = service
+        self._service = service
+        self.router = router
 
     def register(self, app: FastAPI) -> None:
         """Include the API router into FastAPI app."""
-        app.include_router(self.router)
\ No newline at end of file
+        app.include_router(self.router)
@@ -2,15 +2,41 @@ from typing import Any
 import logging
 import time
 
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, HTTPException, Path, Response
+from pydantic import TypeAdapter
 from starlette import status
 
-from app.api.schemas.base import ErrorResponse, ErrorDetail
+from app.api.schemas.base import ErrorResponse
 from app.api.schemas.rating import RatingCreateRequest, RatingCreateResponse
 from app.exceptions.exceptions import ValidationError, NotFoundError
 
 logger = logging.getLogger("movie_rating")
 
+# prebuilt error payload shapes; only the message changes per request so the
+# Pydantic ErrorDetail/ErrorResponse construction stays off the error path
+_404_TEMPLATE = {"status": "failure", "error": {"code": 404, "message": ""}}
+_422_TEMPLATE = {"status": "failure", "error": {"code": 422, "message": ""}}
+
+# built once at import: validates + serializes the success payload without
+# FastAPI re-running the response_model validator per request
+_resp_adapter = TypeAdapter(RatingCreateResponse)
+
+# static route template for log context; never formatted per request
+_ROUTE = "/api/v1/movies/{movie_id}/ratings/"
+
+
+def _error_payload(template: dict, message: str) -> dict:
+    """Fill an error template with the request-specific message.
+
+    Args:
+        template (dict): prebuilt status/code shape.
+        message (str): human readable message.
+
+    Returns:
+        dict: ErrorResponse-shaped payload for HTTPException detail.
+    """
+    return {**template, "error": {**template["error"], "message": message}}
+
 
 class RatingAPI:
     def __init__(self, service: Any) -> None:
@@ -21,71 +47,77 @@ class RatingAPI:
     def _register_routes(self) -> None:
         @self.router.post(
             "/{movie_id}/ratings/",
-            response_model=RatingCreateResponse,
+            response_model=None,
             status_code=status.HTTP_201_CREATED,
             responses={
-                201: {"description": "Created"},
+                201: {"model": RatingCreateResponse},
                 404: {"model": ErrorResponse},
                 422: {"model": ErrorResponse},
                 500: {"description": "Internal server error"},
             },
         )
         async def add_rating(movie_id: int = Path(..., gt=0), body: RatingCreateRequest = ...):
-            route = f"/api/v1/movies/{movie_id}/ratings/"
-            start = time.perf_counter()
-
-            logger.info(
-                "Rating movie (movie_id=%s, rating=%s, route=%s)",
-                movie_id,
-                body.score,
-                route,
-            )
-
-            try:
-                data = self._service.add_rating(movie_id=movie_id, score=body.score)
+            start_ns = time.monotonic_ns()
+            outcome = "saved"
+            error: Any = None
 
-                duration_ms = int((time.perf_counter() - start) * 1000)
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    "Rating saved successfully (movie_id=%s, rating=%s, duration_ms=%s)",
+                    "Rating movie (movie_id=%s, rating=%s, route=%s)",
                     movie_id,
                     body.score,
-                    duration_ms,
+                    _ROUTE,
                 )
-                return RatingCreateResponse(status="success", data=data)
 
-            except NotFoundError as nf:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.warning(
-                    "Rating target movie not found (movie_id=%s, rating=%s, duration_ms=%s)",
-                    movie_id,
-                    body.score,
-                    duration_ms,
+            try:
+                data = await self._service.add_rating(movie_id=movie_id, score=body.score)
+                payload = _resp_adapter.dump_json(
+                    {"status": "success", "data": data}, warnings=False
+                )
+                return Response(
+                    content=payload,
+                    media_type="application/json",
+                    status_code=status.HTTP_201_CREATED,
                 )
-                error_detail = ErrorDetail(code=404, message=str(nf))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=404, detail=error_response.model_dump())
+
+            except NotFoundError as nf:
+                outcome, error = "movie not found", nf
+                raise HTTPException(status_code=404, detail=_error_payload(_404_TEMPLATE, str(nf)))
 
             except ValidationError as ve:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.warning(
-                    "Invalid rating value (movie_id=%s, rating=%s, route=%s, duration_ms=%s, error=%s)",
-                    movie_id,
-                    body.score,
-                    route,
-                    duration_ms,
-                    str(ve),
-                )
-                error_detail = ErrorDetail(code=422, message=str(ve))
-                error_response = ErrorResponse(status="failure", error=error_detail)
-                raise HTTPException(status_code=422, detail=error_response.model_dump())
+                outcome, error = "invalid value", ve
+                raise HTTPException(status_code=422, detail=_error_payload(_422_TEMPLATE, str(ve)))
 
             except Exception as ex:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                logger.error(
-                    "Failed to save rating (movie_id=%s, rating=%s, duration_ms=%s)",
-                    movie_id,
-                    body.score,
-                    duration_ms,
-                    exc_info=True,
-                )
-                raise HTTPException(status_code=500, detail=str(ex))
\ No newline at end of file
+                outcome, error = "failed", ex
+                raise HTTPException(status_code=500, detail=str(ex))
+
+            finally:
+                # single timing block: integer ns math, one log per request
+                duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+                if error is None:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "Rating saved (movie_id=%s, rating=%s, duration_ms=%s)",
+                            movie_id,
+                            body.score,
+                            duration_ms,
+                        )
+                elif outcome == "failed":
+                    logger.error(
+                        "Failed to save rating (movie_id=%s, rating=%s, duration_ms=%s)",
+                        movie_id,
+                        body.score,
+                        duration_ms,
+                        exc_info=error,
+                    )
+                else:
+                    logger.warning(
+                        "Rating %s (movie_id=%s, rating=%s, route=%s, duration_ms=%s, error=%s)",
+                        outcome,
+                        movie_id,
+                        body.score,
+                        _ROUTE,
+                        duration_ms,
+                        error,
+                    )
\ No newline at end of file
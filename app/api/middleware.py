@@ -0,0 +1,78 @@
+from typing import Any, Callable
+
+
+class FastCORS:
+    """Raw ASGI CORS middleware for the wildcard-origin configuration.
+
+    The allowed origins/methods/headers are constant, so the preflight
+    response and the extra response header are precomputed once at
+    construction instead of being rebuilt per request like Starlette's
+    CORSMiddleware does.
+
+    Attributes:
+        _app (Callable): wrapped ASGI application.
+    """
+
+    _PREFLIGHT_HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-methods", b"GET,POST,PUT,DELETE,OPTIONS"),
+        (b"access-control-allow-headers", b"*"),
+        (b"access-control-max-age", b"600"),
+        (b"content-length", b"0"),
+    ]
+    _ALLOW_ORIGIN = (b"access-control-allow-origin", b"*")
+
+    def __init__(self, app: Callable) -> None:
+        """Construct FastCORS.
+
+        Args:
+            app (Callable): downstream ASGI application.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: initializer.
+        """
+        self._app = app
+
+    async def __call__(self, scope: Any, receive: Callable, send: Callable) -> None:
+        """Handle preflight directly; tag other responses with the header.
+
+        Args:
+            scope (Any): ASGI scope.
+            receive (Callable): ASGI receive callable.
+            send (Callable): ASGI send callable.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: delegates errors downstream.
+        """
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if b"origin" not in headers:
+            await self._app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 204,
+                    "headers": self._PREFLIGHT_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_origin(message: Any) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), self._ALLOW_ORIGIN]
+            await send(message)
+
+        await self._app(scope, receive, send_with_origin)
@@ -1,6 +1,6 @@
 from typing import List, Optional, Literal, Annotated
 
-from pydantic import BaseModel, StringConstraints, Field
+from pydantic import BaseModel, ConfigDict, StringConstraints, Field
 
 from app.api.schemas.director import DirectorOut
 
@@ -17,6 +17,8 @@ class MovieOut(BaseModel):
         average_rating (Optional[float]): average rating with one decimal.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     title: str
     release_year: Optional[int]
@@ -32,14 +34,23 @@ class MoviesPageData(BaseModel):
     Attributes:
         page (int): current page number.
         page_size (int): items per page.
-        total_items (int): total movies count.
+        total_items (Optional[int]): total movies count; None unless the
+            caller opted in with ``with_total``.
         items (List[MovieOut]): page items.
+        has_next (Optional[bool]): whether a further offset page exists.
+        has_more (Optional[bool]): whether more rows exist; keyset mode only.
+        next_cursor (Optional[str]): opaque keyset cursor for the next page.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     page: int
     page_size: int
-    total_items: int
+    total_items: Optional[int]
     items: List[MovieOut]
+    has_next: Optional[bool] = None
+    has_more: Optional[bool] = None
+    next_cursor: Optional[str] = None
 
 
 class MoviesListResponse(BaseModel):
@@ -50,6 +61,8 @@ class MoviesListResponse(BaseModel):
         data (MoviesPageData): response data object.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     status: Literal["success", "error"]
     data: MoviesPageData
 
@@ -61,12 +74,16 @@ class MovieDetailResponse(BaseModel):
         status (Literal['success']): response status.
         data (MovieDetailOut): movie detail object.
     """
+    model_config = ConfigDict(defer_build=True)
+
     status: Literal["success"]
     data: MovieOut
 
 
 class MovieCreateRequest(BaseModel):
     """Request body for creating a movie."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     title: Annotated[str, StringConstraints(min_length=1)] = Field(...)
     director_id: int
     release_year: int
@@ -76,11 +93,15 @@ class MovieCreateRequest(BaseModel):
 
 class MovieCreateResponse(BaseModel):
     """Response for created movie resource."""
+    model_config = ConfigDict(defer_build=True)
+
     status: Literal["success"]
     data: MovieOut
 
 class MovieUpdateRequest(BaseModel):
     """Request body for updating a movie."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     title: Annotated[str, StringConstraints(min_length=1)] = Field(...)
     release_year: int
     cast: Optional[str]
@@ -88,5 +109,7 @@ class MovieUpdateRequest(BaseModel):
 
 
 class MovieUpdateResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     status: Literal["success"]
     data: MovieOut
\ No newline at end of file
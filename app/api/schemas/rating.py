@@ -1,9 +1,9 @@
 from typing import Literal, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from app.api.schemas.base import ErrorResponse  # optional usage elsewhere
 
 class RatingCreateRequest(BaseModel):
-    score: int
+    score: int = Field(ge=1, le=10)
 
 class RatingOut(BaseModel):
     rating_id: int
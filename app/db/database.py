@@ -1,17 +1,71 @@
-from typing import Generator, Optional
+from typing import AsyncGenerator, Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 import os
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
 
-_engine: Optional[Engine] = None
-_SessionLocal: Optional[sessionmaker] = None
+_engine: Optional[AsyncEngine] = None
+_SessionLocal: Optional[async_sessionmaker] = None
 Base = declarative_base()
 
+# session shared by all repository calls within one HTTP request; async
+# replacement for the scoped_session pattern of the sync ORM
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "request_session", default=None
+)
+
+
+def current_request_session() -> Optional[AsyncSession]:
+    """Return the session bound to the current request, if any.
+
+    Returns:
+        Optional[AsyncSession]: the request-scoped session or None.
+
+    Raises:
+        None: read-only lookup.
+    """
+    return _request_session.get()
+
+
+@asynccontextmanager
+async def request_session_scope() -> AsyncGenerator[Optional[AsyncSession], None]:
+    """Bind one AsyncSession to the current request context.
+
+    The session is created lazily by SQLAlchemy: no connection is checked
+    out of the pool until the first statement executes, so requests that
+    never touch the database stay free.
+
+    Returns:
+        AsyncGenerator[Optional[AsyncSession], None]: yields the bound
+            session, or None if the engine is not initialized.
+
+    Raises:
+        None: closes the session on exit.
+    """
+    if _SessionLocal is None:
+        yield None
+        return
+    session: AsyncSession = _SessionLocal()
+    token = _request_session.set(session)
+    try:
+        yield session
+    finally:
+        _request_session.reset(token)
+        await session.close()
+
 
 def init_engine(database_url: str) -> None:
-    """Initialize SQLAlchemy engine and session factory.
+    """Initialize the async SQLAlchemy engine and session factory.
+
+    The whole request path is async, so a single pooled async engine
+    (psycopg3 async driver) serves every repository.
 
     Args:
         database_url (str): SQLAlchemy database URL.
@@ -24,12 +78,29 @@ def init_engine(database_url: str) -> None:
     """
     global _engine, _SessionLocal
     if _engine is None:
-        _engine = create_engine(database_url, future=True)
-        _SessionLocal = sessionmaker(bind=_engine, expire_on_commit=False, class_=Session)
+        _engine = create_async_engine(
+            database_url,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            pool_pre_ping=True,
+            echo=False,
+            # sized for every filter-shape permutation of the list queries;
+            # repeat shapes reuse the cached compiled SQL instead of
+            # re-stringifying the statement per request
+            query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
+            connect_args={"prepare_threshold": 0},
+        )
+        _SessionLocal = async_sessionmaker(bind=_engine, expire_on_commit=False)
+
 
+async def close_engine() -> None:
+    """Dispose the SQLAlchemy engine if it exists.
 
-def close_engine() -> None:
-    """Dispose SQLAlchemy engine if exists.
+    Disposal must be awaited: closing pooled psycopg async connections
+    is an async operation, and a synchronous dispose would raise
+    MissingGreenlet whenever the pool is non-empty.
 
     Returns:
         None: nothing.
@@ -39,16 +110,16 @@ def close_engine() -> None:
     """
     global _engine, _SessionLocal
     if _engine is not None:
-        _engine.dispose()
+        await _engine.dispose()
         _engine = None
         _SessionLocal = None
 
 
-def get_session() -> Generator[Session, None, None]:
-    """Yield a SQLAlchemy Session for manual use.
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a SQLAlchemy AsyncSession for manual use.
 
     Returns:
-        Generator[Session, None, None]: yields a session.
+        AsyncGenerator[AsyncSession, None]: yields an async session.
 
     Raises:
         RuntimeError: if sessionmaker is not initialized.
@@ -62,23 +133,23 @@ def get_session() -> Generator[Session, None, None]:
             )
         )
     assert _SessionLocal is not None
-    session: Session = _SessionLocal()
+    session: AsyncSession = _SessionLocal()
     try:
         yield session
     finally:
-        session.close()
+        await session.close()
 
 
-def get_sessionmaker() -> sessionmaker:
-    """Return the initialized sessionmaker.
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Return the initialized async sessionmaker.
 
     Returns:
-        sessionmaker: session factory.
+        async_sessionmaker: async session factory.
 
     Raises:
         RuntimeError: if not initialized.
     """
     global _SessionLocal
     if _SessionLocal is None:
-        raise RuntimeError("Sessionmaker is not initialized; call init_engine first")
+        raise RuntimeError("Async sessionmaker is not initialized; call init_engine first")
     return _SessionLocal
@@ -1,34 +1,47 @@
+import atexit
 import os
 import logging
-from logging.config import dictConfig
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, flushing any buffered records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging() -> None:
-    """Configure application logging (console output)."""
+    """Configure application logging (queued console output).
+
+    Request threads only enqueue records; a background QueueListener
+    owns the StreamHandler so formatting and stderr writes stay off the
+    event loop.
+    """
+    global _listener
     level = os.getenv("LOG_LEVEL", "INFO").upper()
 
-    dictConfig(
-        {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {
-                "default": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                }
-            },
-            "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "formatter": "default",
-                    "level": level,
-                }
-            },
-            "root": {
-                "handlers": ["console"],
-                "level": level,
-            },
-        }
+    console = logging.StreamHandler()
+    console.setLevel(level)
+    console.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     )
 
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+    if _listener is not None:
+        _listener.stop()
+    _listener = QueueListener(log_queue, console, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_listener)
+
     # Optional: reduce uvicorn access noise or keep consistent level
-    logging.getLogger("uvicorn.access").setLevel(os.getenv("UVICORN_ACCESS_LOG_LEVEL", level))
\ No newline at end of file
+    logging.getLogger("uvicorn.access").setLevel(os.getenv("UVICORN_ACCESS_LOG_LEVEL", level))
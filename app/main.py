@@ -1,14 +1,16 @@
 from typing import AsyncIterator
 import os
 from contextlib import asynccontextmanager
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
+from app.api.middleware import FastCORS
 from app.logging_config import setup_logging
 
-from app.db.database import init_engine, close_engine, get_sessionmaker
+from app.db.database import init_engine, close_engine, get_async_sessionmaker, request_session_scope
 from app.repositories.director import DirectorRepository
 from app.repositories.genre import GenreRepository
 from app.repositories.movie import MovieRepository
@@ -66,7 +68,12 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     database_url = os.getenv("DATABASE_URL")
     init_engine(database_url)
 
-    session_factory = get_sessionmaker()
+    # size the sync-offload thread pool to the DB pool so blocking repository
+    # calls are not queued behind the anyio default of 40 tokens
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_TOKENS", "40"))
+
+    session_factory = get_async_sessionmaker()
 
     director_repo = DirectorRepository(session_factory)
     genre_repo = GenreRepository(session_factory)
@@ -76,7 +83,7 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     director_service = DirectorService(director_repo)
     genre_service = GenreService(genre_repo)
     movie_service = MovieService(movie_repo, MAX_PAGE_SIZE, MIN_RELEASE_YEAR)
-    rating_service = RatingService(rating_repo)
+    rating_service = RatingService(rating_repo, on_change=movie_service.on_ratings_changed)
 
     director_api = DirectorAPI(director_service)
     genre_api = GenreAPI(genre_service)
@@ -86,6 +93,8 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     application.include_router(movie_api.router)
     application.include_router(rating_api.router)
 
+    await rating_service.start()
+
     application.state = AppState(
         director_api=director_api,
         genre_api=genre_api,
@@ -96,22 +105,33 @@ async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     try:
         yield
     finally:
-        close_engine()
+        await rating_service.stop()
+        await close_engine()
 
 
 app = FastAPI(
     title="Movie Rating System - Phase1",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-cors_options = {
-    "allow_origins": ["*"],
-    "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    "allow_headers": ["*"],
-}
 
-app.add_middleware(CORSMiddleware, **cors_options)
+@app.middleware("http")
+async def request_session_middleware(request, call_next):
+    """Bind one DB session to the request so repositories share it.
+
+    Args:
+        request: incoming request.
+        call_next: downstream handler.
+
+    Returns:
+        Response: downstream response.
+    """
+    async with request_session_scope():
+        return await call_next(request)
+
+app.add_middleware(FastCORS)
 
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Float, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -19,6 +19,9 @@ class Movie(Base):
     director_id = Column(Integer, ForeignKey("directors.id"), nullable=False)
     release_year = Column(Integer, nullable=True)
     cast = Column(String(1024), nullable=True)
+    # denormalized rating aggregates, maintained by the rating write path
+    avg_rating = Column(Float, nullable=True)
+    ratings_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     director = relationship("Director", back_populates="movies")
     genres = relationship("MovieGenre", back_populates="movie")
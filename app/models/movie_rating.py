@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -13,6 +13,7 @@ class MovieRating(Base):
     """
 
     __tablename__ = "movie_ratings"
+    __table_args__ = (Index("ix_mr_movie_score", "movie_id", "score"),)
 
     id = Column(Integer, primary_key=True)
     movie_id = Column(Integer, ForeignKey("movies.id"), nullable=False)
@@ -1,4 +1,7 @@
-from typing import Any
+from typing import Any, AsyncGenerator
+from contextlib import asynccontextmanager
+
+from app.db.database import current_request_session
 
 
 class BaseRepository:
@@ -21,3 +24,25 @@ class BaseRepository:
             None: simple initializer.
         """
         self._session_factory = session_factory
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncGenerator[Any, None]:
+        """Yield the request-scoped session, or open a fresh one.
+
+        Repository calls inside an HTTP request all reuse the session
+        bound by request_session_scope, paying one pool checkout per
+        request; callers outside a request (background tasks, scripts)
+        get a session from the factory as before.
+
+        Returns:
+            AsyncGenerator[Any, None]: yields an AsyncSession.
+
+        Raises:
+            None: the factory-owned session is closed on exit.
+        """
+        shared = current_request_session()
+        if shared is not None:
+            yield shared
+        else:
+            async with self._session_factory() as session:
+                yield session
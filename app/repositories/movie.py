@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import Numeric, cast, delete, exists, func, insert, select
+from sqlalchemy.exc import IntegrityError
 
 from app.repositories.base import BaseRepository
 from app.models import Genre, Movie, MovieGenre, MovieRating, Director
@@ -11,14 +11,14 @@ class MovieRepository(BaseRepository):
     """Repository for movie-related DB access.
 
     Attributes:
-        _session_factory (Any): session factory.
+        _session_factory (Any): async session factory.
     """
 
     def __init__(self, session_factory: Any) -> None:
         """Construct MovieRepository.
 
         Args:
-            session_factory (Any): session maker or factory.
+            session_factory (Any): async session maker or factory.
 
         Returns:
             None: nothing.
@@ -30,39 +30,55 @@ class MovieRepository(BaseRepository):
 
     def _apply_filters(
         self,
-        query,
+        stmt,
         title: Optional[str] = None,
         release_year: Optional[int] = None,
         genre: Optional[str] = None,
     ):
-        """Apply title/release_year/genre filters to a SQLAlchemy query.
+        """Apply title/release_year/genre filters to a SQLAlchemy statement.
 
         Args:
-            query: SQLAlchemy query object.
+            stmt: SQLAlchemy select statement.
             title (Optional[str]): partial title to match.
             release_year (Optional[int]): exact release year.
             genre (Optional[str]): exact genre name.
 
+        The contains-ILIKE on title relies on the ix_movies_title_trgm
+        GIN index (pg_trgm); trigram lookups need at least 3 characters,
+        so shorter terms fall back to an anchored prefix match instead
+        of forcing a sequential scan.
+
         Returns:
-            Any: modified query.
+            Any: modified statement.
 
         Raises:
             None: no runtime raise.
         """
         if title:
-            query = query.filter(Movie.title.ilike(f"%{title}%"))
+            if len(title) >= 3:
+                stmt = stmt.where(Movie.title.ilike(f"%{title}%"))
+            else:
+                stmt = stmt.where(Movie.title.ilike(f"{title}%"))
         if release_year is not None:
-            query = query.filter(Movie.release_year == release_year)
+            stmt = stmt.where(Movie.release_year == release_year)
         if genre:
-            query = query.join(Movie.genres).join(MovieGenre.genre).filter(Genre.name == genre)
-        return query
+            # correlated EXISTS keeps the row set un-multiplied, so callers
+            # need neither DISTINCT nor a de-duplicating GROUP BY
+            stmt = stmt.where(
+                select(1)
+                .select_from(MovieGenre)
+                .join(Genre, MovieGenre.genre_id == Genre.id)
+                .where(MovieGenre.movie_id == Movie.id, Genre.name == genre)
+                .correlate(Movie)
+                .exists()
+            )
+        return stmt
 
-    def _format_movie(self, movie: Movie, ratings: dict = None) -> Dict[str, Any]:
-        """Format movie with genres, director, and optional average rating.
+    def _row_to_movie(self, row: Any) -> Dict[str, Any]:
+        """Format one aggregated page-query row into the movie dict shape.
 
         Args:
-            movie (Movie): SQLAlchemy Movie instance.
-            ratings (dict): optional movie_id to average_rating map.
+            row: result row from the windowed page query.
 
         Returns:
             Dict[str, Any]: formatted movie data.
@@ -70,60 +86,67 @@ class MovieRepository(BaseRepository):
         Raises:
             None: pure formatter.
         """
-        genre_names = [mg.genre.name for mg in movie.genres if mg.genre and mg.genre.name]
-        director_dict = {
-            "id": movie.director.id if movie.director else None,
-            "name": movie.director.name if movie.director else None,
-            "birth_year": getattr(movie.director, "birth_year", None),
-            "description": getattr(movie.director, "description", None),
-        } if getattr(movie, "director", None) else {}
-
-        avg = ratings.get(movie.id) if ratings else None
-
         return {
-            "id": movie.id,
-            "title": movie.title,
-            "release_year": movie.release_year,
-            "cast": getattr(movie, "cast", None),
-            "director": director_dict,
-            "genres": genre_names,
-            "average_rating": float(avg) if avg is not None else None,
-            "ratings_count": getattr(movie, "ratings_count", 0),
+            "id": row.id,
+            "title": row.title,
+            "release_year": row.release_year,
+            "cast": row.cast,
+            "director": {
+                "id": row.director_id,
+                "name": row.director_name,
+                "birth_year": row.director_birth_year,
+                "description": row.director_description,
+            } if row.director_id is not None else {},
+            "genres": [name for name in (row.genres or []) if name],
+            "average_rating": float(row.avg) if row.avg is not None else None,
+            "ratings_count": int(row.ratings_count or 0),
         }
 
-    def _fetch_movies_with_ratings(self, session, movies: List[Movie]) -> List[Dict[str, Any]]:
-        """Fetch related ratings and format movies for given list.
+    def _page_select(self, paged) -> Any:
+        """Build the aggregated outer select over a page-of-ids subquery.
+
+        Joins director and genres in one statement; rating stats come from
+        the denormalized movies.avg_rating/ratings_count columns, so the
+        movie_ratings table is never touched on reads.
 
         Args:
-            session: SQLAlchemy session.
-            movies (List[Movie]): list of Movie instances.
+            paged: subquery yielding the page's movie ids.
 
         Returns:
-            List[Dict[str, Any]]: formatted movie dicts.
+            Any: select statement producing one row per movie.
 
         Raises:
-            None: pure fetch/format.
+            None: pure statement builder.
         """
-        movie_ids = [m.id for m in movies]
-        ratings: Dict[int, float] = {}
-
-        if movie_ids:
-            rows = (
-                session.query(MovieRating.movie_id, func.avg(MovieRating.score).label("avg"))
-                .filter(MovieRating.movie_id.in_(movie_ids))
-                .group_by(MovieRating.movie_id)
-                .all()
+        return (
+            select(
+                Movie.id,
+                Movie.title,
+                Movie.release_year,
+                Movie.cast,
+                Director.id.label("director_id"),
+                Director.name.label("director_name"),
+                Director.birth_year.label("director_birth_year"),
+                Director.description.label("director_description"),
+                func.array_agg(Genre.name)
+                .filter(Genre.name.isnot(None))
+                .label("genres"),
+                func.round(cast(Movie.avg_rating, Numeric), 1).label("avg"),
+                Movie.ratings_count.label("ratings_count"),
             )
-            ratings = {r.movie_id: float(r.avg) for r in rows}
-
-        for m in movies:
-            if not hasattr(m, "ratings_count"):
-                row_count = session.query(func.count(MovieRating.id)).filter(MovieRating.movie_id == m.id).scalar()
-                m.ratings_count = int(row_count or 0)
-
-        return [self._format_movie(m, ratings) for m in movies]
+            .select_from(paged)
+            .join(Movie, Movie.id == paged.c.id)
+            .outerjoin(Director, Director.id == Movie.director_id)
+            .outerjoin(MovieGenre, MovieGenre.movie_id == Movie.id)
+            .outerjoin(Genre, Genre.id == MovieGenre.genre_id)
+            .group_by(
+                Movie.id,
+                Director.id,
+            )
+            .order_by(Movie.id)
+        )
 
-    def list_paginated(
+    async def list_paginated(
         self,
         page: int,
         page_size: int,
@@ -133,6 +156,11 @@ class MovieRepository(BaseRepository):
     ) -> Tuple[List[Dict[str, Any]], int]:
         """Return paginated movies and total count with optional filters.
 
+        Runs a single statement: an inner page-of-ids subquery carrying a
+        window COUNT(*) OVER() for the filtered total, joined to the
+        director/genre/rating aggregates. Replaces the previous separate
+        count, page and ratings queries.
+
         Args:
             page (int): page number.
             page_size (int): items per page.
@@ -148,25 +176,137 @@ class MovieRepository(BaseRepository):
         """
         offset = (page - 1) * page_size
 
-        with self._session_factory() as session:
-            base_q = session.query(Movie)
-            base_q = base_q.options(
-                joinedload(Movie.director),
-                selectinload(Movie.genres).joinedload(MovieGenre.genre),
+        inner = select(Movie.id.label("id"), func.count().over().label("total"))
+        inner = self._apply_filters(inner, title=title, release_year=release_year, genre=genre)
+        paged = (
+            inner.order_by(Movie.id)
+            .offset(offset)
+            .limit(page_size)
+            .subquery("paged_ids")
+        )
+
+        stmt = self._page_select(paged).add_columns(paged.c.total).group_by(paged.c.total)
+
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).all()
+            if rows:
+                return [self._row_to_movie(r) for r in rows], int(rows[0].total)
+
+            # page past the end: the window total came back with no rows,
+            # so fall back to a plain filtered count
+            total_stmt = select(func.count(Movie.id))
+            total_stmt = self._apply_filters(
+                total_stmt, title=title, release_year=release_year, genre=genre
             )
+            total_items = int((await session.execute(total_stmt)).scalar() or 0)
+            return [], total_items
 
-            filtered_q = self._apply_filters(base_q, title=title, release_year=release_year, genre=genre)
+    async def list_page(
+        self,
+        page: int,
+        page_size: int,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return one offset page of movies without the total count.
 
-            total_q = session.query(func.count(func.distinct(Movie.id)))
-            total_q = self._apply_filters(total_q.select_from(Movie), title=title, release_year=release_year, genre=genre)
-            total_items = int(total_q.scalar() or 0)
+        Args:
+            page (int): page number.
+            page_size (int): items per page; also sets the page offset.
+            title (Optional[str]): partial title to search.
+            release_year (Optional[int]): filter by release year.
+            genre (Optional[str]): filter by genre name.
+            limit (Optional[int]): row cap overriding page_size; lets the
+                caller over-fetch one row to detect a next page.
 
-            movies = filtered_q.order_by(Movie.id).distinct(Movie.id).offset(offset).limit(page_size).all()
+        Returns:
+            List[Dict[str, Any]]: list of formatted movies.
+
+        Raises:
+            None: returns empty list past the last page.
+        """
+        offset = (page - 1) * page_size
 
-            items = self._fetch_movies_with_ratings(session, movies)
-            return items, total_items
+        inner = select(Movie.id.label("id"))
+        inner = self._apply_filters(inner, title=title, release_year=release_year, genre=genre)
+        paged = (
+            inner.order_by(Movie.id)
+            .offset(offset)
+            .limit(limit if limit is not None else page_size)
+            .subquery("paged_ids")
+        )
 
-    def get_by_id(self, movie_id: int) -> Optional[Dict[str, Any]]:
+        async with self._session() as session:
+            rows = (await session.execute(self._page_select(paged))).all()
+            return [self._row_to_movie(r) for r in rows]
+
+    async def list_keyset(
+        self,
+        after_id: Optional[int],
+        page_size: int,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return one keyset page of movies ordered by id.
+
+        Args:
+            after_id (Optional[int]): last movie id of the previous page.
+            page_size (int): items per page.
+            title (Optional[str]): partial title to search.
+            release_year (Optional[int]): filter by release year.
+            genre (Optional[str]): filter by genre name.
+
+        Returns:
+            List[Dict[str, Any]]: list of formatted movies.
+
+        Raises:
+            None: returns empty list past the last page.
+        """
+        inner = select(Movie.id.label("id"))
+        inner = self._apply_filters(inner, title=title, release_year=release_year, genre=genre)
+        if after_id is not None:
+            inner = inner.where(Movie.id > after_id)
+        paged = (
+            inner.order_by(Movie.id)
+            .limit(page_size)
+            .subquery("paged_ids")
+        )
+
+        async with self._session() as session:
+            rows = (await session.execute(self._page_select(paged))).all()
+            return [self._row_to_movie(r) for r in rows]
+
+    async def iter_all(self, chunk: int = 500) -> AsyncIterator[Tuple[int, str, Optional[int]]]:
+        """Stream (id, title, release_year) tuples over the whole table.
+
+        Uses server-side cursor streaming (``yield_per``) so memory stays
+        bounded regardless of table size; meant for export/maintenance
+        paths. The paginated list methods keep ``.all()`` since page_size
+        is bounded.
+
+        Args:
+            chunk (int): rows fetched per round-trip.
+
+        Returns:
+            AsyncIterator[Tuple[int, str, Optional[int]]]: streamed rows.
+
+        Raises:
+            None: iteration errors propagate.
+        """
+        stmt = (
+            select(Movie.id, Movie.title, Movie.release_year)
+            .order_by(Movie.id)
+            .execution_options(yield_per=chunk)
+        )
+        async with self._session() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield (row[0], row[1], row[2])
+
+    async def get_by_id(self, movie_id: int) -> Optional[Dict[str, Any]]:
         """Fetch single movie by id with related metadata.
 
         Args:
@@ -178,39 +318,27 @@ class MovieRepository(BaseRepository):
         Raises:
             None: returns None if not found.
         """
-        with self._session_factory() as session:
-            movie = (
-                session.query(Movie)
-                .options(
-                    joinedload(Movie.director),
-                    selectinload(Movie.genres).joinedload(MovieGenre.genre),
-                )
-                .filter(Movie.id == movie_id)
-                .one_or_none()
-            )
-            if not movie:
-                return None
-
-            row = session.query(
-                func.avg(MovieRating.score).label("avg"),
-                func.count(MovieRating.id).label("count"),
-            ).filter(MovieRating.movie_id == movie_id).one()
+        paged = select(Movie.id.label("id")).where(Movie.id == movie_id).subquery("paged_ids")
 
-            movie.ratings_count = int(row.count or 0)
+        async with self._session() as session:
+            row = (await session.execute(self._page_select(paged))).one_or_none()
+            return self._row_to_movie(row) if row is not None else None
 
-            items = self._fetch_movies_with_ratings(session, [movie])
-            return items[0] if items else None
-
-    def create_movie(
+    async def create_movie(
         self,
         title: str,
         director_id: int,
         release_year: Optional[int],
         cast: Optional[str],
         genre_ids: List[int],
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """Create movie record and association rows.
 
+        The director and genre foreign keys double as the authoritative
+        existence checks: they are enforced inside this transaction, so
+        the service's cached pre-checks need no second round trip and a
+        reference deleted in between cannot slip through.
+
         Args:
             title (str): movie title.
             director_id (int): director id.
@@ -219,25 +347,69 @@ class MovieRepository(BaseRepository):
             genre_ids (List[int]): list of genre ids.
 
         Returns:
-            Dict[str, Any]: formatted created movie dict.
+            Optional[Dict[str, Any]]: formatted created movie dict, or
+                None when a referenced director or genre does not exist.
 
         Raises:
-            None: caller validates inputs.
+            None: other database errors propagate.
         """
-        with self._session_factory() as session:
-            movie = Movie(title=title, director_id=director_id, release_year=release_year, cast=cast)
-            session.add(movie)
-            session.flush()
+        async with self._session() as session:
+            try:
+                movie = Movie(
+                    title=title, director_id=director_id, release_year=release_year, cast=cast
+                )
+                session.add(movie)
+                await session.flush()
+
+                if genre_ids:
+                    await session.execute(
+                        insert(MovieGenre),
+                        [{"movie_id": movie.id, "genre_id": gid} for gid in genre_ids],
+                    )
+            except IntegrityError:
+                await session.rollback()
+                return None
 
+            # the response is assembled from what we already hold plus two
+            # cheap lookups, instead of re-reading the movie with all its
+            # aggregates via get_by_id
+            director_row = (
+                await session.execute(
+                    select(
+                        Director.id,
+                        Director.name,
+                        Director.birth_year,
+                        Director.description,
+                    ).where(Director.id == director_id)
+                )
+            ).one_or_none()
+            genre_names: List[str] = []
             if genre_ids:
-                for gid in genre_ids:
-                    mg = MovieGenre(movie_id=movie.id, genre_id=gid)
-                    session.add(mg)
-
-            session.commit()
-            return self.get_by_id(movie.id)
+                genre_names = list(
+                    (
+                        await session.execute(select(Genre.name).where(Genre.id.in_(genre_ids)))
+                    ).scalars()
+                )
 
-    def exists_director(self, director_id: int) -> bool:
+            await session.commit()
+
+            return {
+                "id": movie.id,
+                "title": title,
+                "release_year": release_year,
+                "cast": cast,
+                "director": {
+                    "id": director_row.id,
+                    "name": director_row.name,
+                    "birth_year": director_row.birth_year,
+                    "description": director_row.description,
+                } if director_row is not None else {},
+                "genres": genre_names,
+                "average_rating": None,
+                "ratings_count": 0,
+            }
+
+    async def exists_director(self, director_id: int) -> bool:
         """Return True if director with id exists.
 
         Args:
@@ -249,27 +421,61 @@ class MovieRepository(BaseRepository):
         Raises:
             None: simple check.
         """
-        with self._session_factory() as session:
-            return session.query(Director).filter(Director.id == director_id).first() is not None
+        async with self._session() as session:
+            # EXISTS probe: boolean result, no column fetch or ORM hydration
+            return bool(
+                (
+                    await session.execute(
+                        select(exists().where(Director.id == director_id))
+                    )
+                ).scalar()
+            )
 
-    def count_genres_by_ids(self, genre_ids: List[int]) -> int:
-        """Return number of genres that match provided ids.
+    async def all_genre_ids(self) -> List[int]:
+        """Return the ids of every genre row.
+
+        The genres table is small, static reference data; the service
+        caches this set so movie writes skip the per-request membership
+        query.
+
+        Returns:
+            List[int]: all genre ids.
+
+        Raises:
+            None: simple scan.
+        """
+        async with self._session() as session:
+            return list((await session.execute(select(Genre.id))).scalars())
+
+    async def missing_genre_ids(self, genre_ids: List[int]) -> Set[int]:
+        """Return which of the given genre ids do not exist.
+
+        Fetching the matching ids instead of an aggregate count lets the
+        caller name the offending ids in its error message.
 
         Args:
             genre_ids (List[int]): list of genre ids.
 
         Returns:
-            int: matched genres count.
+            Set[int]: ids with no genre row; empty when all exist.
 
         Raises:
-            None: simple count.
+            None: simple lookup.
         """
-        if not genre_ids:
-            return 0
-        with self._session_factory() as session:
-            return session.query(func.count(Genre.id)).filter(Genre.id.in_(genre_ids)).scalar() or 0
+        # dedupe before binding: fewer parameters keeps the
+        # statement-shape cache hot
+        unique_ids = {int(g) for g in genre_ids}
+        if not unique_ids:
+            return set()
+        async with self._session() as session:
+            found = set(
+                (
+                    await session.execute(select(Genre.id).where(Genre.id.in_(unique_ids)))
+                ).scalars()
+            )
+            return unique_ids - found
 
-    def update_movie(
+    async def update_movie(
         self,
         movie_id: int,
         title: str,
@@ -277,8 +483,10 @@ class MovieRepository(BaseRepository):
         cast: Optional[str],
         genre_ids: List[int],
     ) -> Optional[Dict[str, Any]]:
-        with self._session_factory() as session:
-            movie = session.query(Movie).filter(Movie.id == movie_id).one_or_none()
+        async with self._session() as session:
+            movie = (
+                await session.execute(select(Movie).where(Movie.id == movie_id))
+            ).scalar_one_or_none()
             if movie is None:
                 return None
 
@@ -287,33 +495,48 @@ class MovieRepository(BaseRepository):
             movie.release_year = release_year
             movie.cast = cast
 
-            # sync genres in association table (MovieGenre)
-            existing = session.query(MovieGenre).filter(MovieGenre.movie_id == movie_id).all()
-            existing_ids = {mg.genre_id for mg in existing}
+            # sync genres in association table (MovieGenre) as a diff:
+            # one bulk DELETE for removed ids, one bulk INSERT for added ids
+            existing_ids = set(
+                (
+                    await session.execute(
+                        select(MovieGenre.genre_id).where(MovieGenre.movie_id == movie_id)
+                    )
+                ).scalars().all()
+            )
             new_ids = set(genre_ids or [])
 
-            # delete removed
-            for mg in existing:
-                if mg.genre_id not in new_ids:
-                    session.delete(mg)
+            removed = existing_ids - new_ids
+            if removed:
+                await session.execute(
+                    delete(MovieGenre).where(
+                        MovieGenre.movie_id == movie_id,
+                        MovieGenre.genre_id.in_(removed),
+                    )
+                )
 
-            # add added
-            for gid in new_ids - existing_ids:
-                session.add(MovieGenre(movie_id=movie_id, genre_id=gid))
+            added = new_ids - existing_ids
+            if added:
+                await session.execute(
+                    insert(MovieGenre),
+                    [{"movie_id": movie_id, "genre_id": gid} for gid in added],
+                )
 
-            session.commit()
-            return self.get_by_id(movie_id)
+            await session.commit()
+            return await self.get_by_id(movie_id)
 
-    def delete_movie(self, movie_id: int) -> bool:
-        with self._session_factory() as session:
-            movie = session.query(Movie).filter(Movie.id == movie_id).one_or_none()
+    async def delete_movie(self, movie_id: int) -> bool:
+        async with self._session() as session:
+            movie = (
+                await session.execute(select(Movie).where(Movie.id == movie_id))
+            ).scalar_one_or_none()
             if movie is None:
                 return False
 
             # delete dependent rows (as required by doc)
-            session.query(MovieGenre).filter(MovieGenre.movie_id == movie_id).delete(synchronize_session=False)
-            session.query(MovieRating).filter(MovieRating.movie_id == movie_id).delete(synchronize_session=False)
+            await session.execute(delete(MovieGenre).where(MovieGenre.movie_id == movie_id))
+            await session.execute(delete(MovieRating).where(MovieRating.movie_id == movie_id))
 
-            session.delete(movie)
-            session.commit()
+            await session.delete(movie)
+            await session.commit()
             return True
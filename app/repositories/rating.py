@@ -1,6 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
 from app.repositories.base import BaseRepository
 from app.models import Movie, MovieRating
 
@@ -8,19 +11,196 @@ class RatingRepository(BaseRepository):
     def __init__(self, session_factory: Any) -> None:
         super().__init__(session_factory)
 
-    def add_rating(self, movie_id: int, score: int) -> Optional[MovieRating]:
-        with self._session_factory() as session:
-            movie = session.query(Movie).filter(Movie.id == movie_id).one_or_none()
-            if movie is None:
-                return None
-
+    async def add_rating(self, movie_id: int, score: int) -> Optional[MovieRating]:
+        async with self._session() as session:
             rating = MovieRating(
                 movie_id=movie_id,
                 score=score,
                 rated_at=datetime.now(timezone.utc)
             )
-
             session.add(rating)
-            session.commit()
-            session.refresh(rating)
+            try:
+                await session.flush()
+                await self._bump_aggregates(session, {movie_id: (1, score)})
+                # the FK on movie_id enforces existence; no pre-check SELECT
+                await session.commit()
+            except IntegrityError:
+                await session.rollback()
+                return None
+            await session.refresh(rating)
             return rating
+
+    async def add_ratings_batch(
+        self, entries: List[Tuple[int, int]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Insert a batch of ratings with one statement and one commit.
+
+        The insert runs optimistically against the movie_id FK: when every
+        movie exists (the common case) the batch costs a single round-trip.
+        Only on an FK violation is a membership query issued to attribute
+        the misses, and the valid subset is retried.
+
+        Args:
+            entries (List[Tuple[int, int]]): (movie_id, score) pairs.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: per entry, a rating dict with
+                id/movie_id/score/rated_at, or None if the movie is missing.
+
+        Raises:
+            None: database errors propagate to the caller.
+        """
+        async with self._session() as session:
+            now = datetime.now(timezone.utc)
+
+            rows = await self._try_insert(session, entries, now)
+            if rows is not None:
+                return self._zip_results(entries, set(mid for mid, _ in entries), rows)
+
+            # FK violation: find which movies exist, retry the valid subset
+            existing: Set[int] = set(
+                (
+                    await session.execute(
+                        select(Movie.id).where(Movie.id.in_({mid for mid, _ in entries}))
+                    )
+                ).scalars()
+            )
+            valid = [(mid, score) for mid, score in entries if mid in existing]
+            rows = []
+            if valid:
+                rows = await self._try_insert(session, valid, now)
+                if rows is None:  # movie deleted between check and retry
+                    rows = []
+            return self._zip_results(entries, existing, rows)
+
+
+    @staticmethod
+    async def _bump_aggregates(session: Any, deltas: Dict[int, Tuple[int, int]]) -> None:
+        """Fold rating deltas into the movies' denormalized aggregates.
+
+        Runs inside the caller's insert transaction so the counters never
+        drift from the rating rows.
+
+        Args:
+            session (Any): active async session.
+            deltas (Dict[int, Tuple[int, int]]): movie_id to
+                (added count, added score sum).
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: integrity errors propagate to the caller.
+        """
+        stmt = (
+            update(Movie)
+            .where(Movie.id == bindparam("mid"))
+            .values(
+                avg_rating=(
+                    func.coalesce(Movie.avg_rating, 0.0) * Movie.ratings_count
+                    + bindparam("score_sum")
+                )
+                / (Movie.ratings_count + bindparam("cnt")),
+                ratings_count=Movie.ratings_count + bindparam("cnt"),
+            )
+        )
+        # executemany must go through the Core connection: the ORM session
+        # rejects bulk UPDATEs with extra WHERE criteria (it cannot
+        # synchronize persistent objects for them)
+        connection = await session.connection()
+        await connection.execute(
+            stmt,
+            [
+                {"mid": mid, "cnt": cnt, "score_sum": total}
+                for mid, (cnt, total) in deltas.items()
+            ],
+        )
+
+    async def _try_insert(
+        self, session: Any, entries: List[Tuple[int, int]], now: datetime
+    ) -> Optional[List[Any]]:
+        """Attempt the multi-row INSERT; None signals an FK violation.
+
+        Args:
+            session (Any): active async session.
+            entries (List[Tuple[int, int]]): (movie_id, score) pairs.
+            now (datetime): shared rated_at timestamp.
+
+        Returns:
+            Optional[List[Any]]: RETURNING rows, or None on IntegrityError.
+
+        Raises:
+            None: other database errors propagate.
+        """
+        if not entries:
+            return []
+        try:
+            rows = (
+                await session.execute(
+                    insert(MovieRating)
+                    .values(
+                        [
+                            {"movie_id": mid, "score": score, "rated_at": now}
+                            for mid, score in entries
+                        ]
+                    )
+                    .returning(
+                        MovieRating.id,
+                        MovieRating.movie_id,
+                        MovieRating.score,
+                        MovieRating.rated_at,
+                    )
+                )
+            ).all()
+
+            deltas: Dict[int, Tuple[int, int]] = {}
+            for mid, score in entries:
+                cnt, total = deltas.get(mid, (0, 0))
+                deltas[mid] = (cnt + 1, total + score)
+            await self._bump_aggregates(session, deltas)
+
+            await session.commit()
+            return rows
+        except IntegrityError:
+            await session.rollback()
+            return None
+
+    @staticmethod
+    def _zip_results(
+        entries: List[Tuple[int, int]], existing: Set[int], rows: List[Any]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Map RETURNING rows back onto the original entry order.
+
+        RETURNING preserves the VALUES order, so the rows are walked in
+        lockstep with the valid entries while misses keep None slots.
+
+        Args:
+            entries (List[Tuple[int, int]]): original (movie_id, score) pairs.
+            existing (Set[int]): movie ids that were inserted for.
+            rows (List[Any]): RETURNING rows for the valid subset.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: per-entry rating dicts or None.
+
+        Raises:
+            None: pure reshaping.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        it = iter(rows)
+        for mid, _score in entries:
+            if mid not in existing:
+                results.append(None)
+                continue
+            row = next(it, None)
+            if row is None:
+                results.append(None)
+                continue
+            results.append(
+                {
+                    "id": row.id,
+                    "movie_id": row.movie_id,
+                    "score": row.score,
+                    "rated_at": row.rated_at,
+                }
+            )
+        return results
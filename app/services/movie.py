@@ -1,8 +1,59 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+from collections import OrderedDict
 from datetime import datetime
+import asyncio
+import base64
+import binascii
+import time
+
+import orjson
 
 from app.exceptions.exceptions import ValidationError, NotFoundError
 from app.services.base import BaseService
+from app.services._fmt import format_movie_detail, format_movie_page
+
+# [year, monotonic expiry] — the wall-clock year changes once a year, so
+# hot validation paths refresh it hourly instead of per call
+_YEAR_CACHE: List = [0, 0.0]
+
+# [epoch second, formatted string] — one strftime per second at most
+_TS_CACHE: List = [0, ""]
+
+
+def _current_year() -> int:
+    """Return the current calendar year, refreshed at most hourly.
+
+    Returns:
+        int: current year.
+
+    Raises:
+        None: falls through to datetime.now on expiry.
+    """
+    if time.monotonic() >= _YEAR_CACHE[1]:
+        _YEAR_CACHE[0] = datetime.now().year
+        _YEAR_CACHE[1] = time.monotonic() + 3600.0
+    return _YEAR_CACHE[0]
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an RFC3339 string, second precision.
+
+    Returns:
+        str: timestamp like ``2026-08-29T12:00:00Z``.
+
+    Raises:
+        None: reformats only when the second ticks over.
+    """
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        # time.gmtime plus one f-string: no datetime object, no strftime
+        tm = time.gmtime(now)
+        _TS_CACHE[1] = (
+            f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z"
+        )
+    return _TS_CACHE[1]
 
 
 class MovieService(BaseService):
@@ -14,6 +65,14 @@ class MovieService(BaseService):
         _min_release_year (int): minimum allowed release year.
     """
 
+    _LIST_CACHE_TTL = 30.0
+    _LIST_CACHE_MAX = 1024
+    _DETAIL_CACHE_TTL = 60.0
+    _DETAIL_CACHE_MAX = 10_000
+    _COUNT_CACHE_TTL = 30.0
+    _REF_CACHE_TTL = 60.0
+    _DIRECTOR_CACHE_MAX = 1024
+
     def __init__(self, repo: Any, max_page_size: int, min_release_year: int) -> None:
         """Construct MovieService.
 
@@ -31,6 +90,14 @@ class MovieService(BaseService):
         super().__init__(repo)
         self._max_page_size = max_page_size
         self._min_release_year = min_release_year
+        self._list_cache: Dict[tuple, tuple] = {}
+        self._list_cache_version = 0
+        self._detail_cache: "OrderedDict[int, tuple]" = OrderedDict()
+        self._count_cache: Dict[tuple, tuple] = {}
+        self._inflight_details: Dict[int, asyncio.Future] = {}
+        self._genre_ids: Optional[frozenset] = None
+        self._genre_ids_expiry = 0.0
+        self._director_cache: Dict[int, float] = {}
 
     def _validate_pagination(self, page_size: int) -> None:
         """Validate pagination parameters.
@@ -59,66 +126,84 @@ class MovieService(BaseService):
         Raises:
             ValidationError: when year not in [min_release_year, current_year].
         """
-        current_year = datetime.now().year
-        if release_year < self._min_release_year or release_year > current_year:
+        if release_year < self._min_release_year or release_year > _current_year():
             raise ValidationError("Invalid release_year")
 
-    def _format_output(self, raw: Dict[str, Any], detail: bool = False) -> Dict[str, Any]:
-        """Common output formatter for movie dicts.
+    def _validate_release_year_batch(self, years: "Iterable[int]") -> None:
+        """Validate many release years against bounds computed once.
+
+        Meant for bulk write paths: the year bounds are hoisted out of
+        the loop so N rows cost N comparisons, not N clock lookups.
 
         Args:
-            raw (Dict[str, Any]): raw movie dict.
-            detail (bool): include full details if True.
+            years (Iterable[int]): years to validate; None entries skip.
 
         Returns:
-            Dict[str, Any]: formatted movie output.
+            None: nothing.
 
         Raises:
-            None: pure formatter.
+            ValidationError: when any year is out of range.
         """
-        avg = raw.get("average_rating")
-        average_rating = None if avg is None else round(float(avg), 1)
+        min_y, max_y = self._min_release_year, _current_year()
+        bad = [y for y in years if y is not None and not (min_y <= y <= max_y)]
+        if bad:
+            raise ValidationError(f"Invalid release_year: {sorted(set(bad))}")
+
+    @staticmethod
+    def _normalize_filters(
+        title: Optional[str], genre: Optional[str]
+    ) -> "tuple[Optional[str], Optional[str]]":
+        """Canonicalize filter strings before caching and querying.
+
+        Stripping whitespace and collapsing empty strings to None keeps
+        one cache entry and one statement shape per logical filter
+        instead of one per raw variant. Case is preserved: the genre
+        filter matches names exactly and title search is already
+        case-insensitive via ILIKE.
 
-        director_info = raw.get("director", {}) or {}
-        director_formatted = {"id": director_info.get("id"), "name": director_info.get("name")}
-        if detail:
-            director_formatted["birth_year"] = director_info.get("birth_year")
-            director_formatted["description"] = director_info.get("description")
+        Args:
+            title (Optional[str]): raw title filter.
+            genre (Optional[str]): raw genre filter.
 
-        # ensure these optional fields are present (so Pydantic validation won't fail)
-        ratings_count_value = raw.get("ratings_count")
-        if ratings_count_value is None:
-            ratings_count_value = 0
+        Returns:
+            tuple[Optional[str], Optional[str]]: canonical (title, genre).
 
-        output = {
-            "id": raw["id"],
-            "title": raw["title"],
-            "release_year": raw.get("release_year"),
-            "director": director_formatted,
-            "genres": list(raw.get("genres", [])),
-            "average_rating": average_rating,
-            "ratings_count": int(ratings_count_value),
-        }
-        if detail:
-            output["cast"] = raw.get("cast")
-        return output
+        Raises:
+            None: pure normalizer.
+        """
+        if title is not None:
+            title = title.strip() or None
+        if genre is not None:
+            genre = genre.strip() or None
+        return title, genre
 
-    def get_movies_paginated(
+    async def get_movies_paginated(
         self,
         page: int = 1,
         page_size: int = 10,
         title: Optional[str] = None,
         release_year: Optional[int] = None,
         genre: Optional[str] = None,
+        after_id: Optional[int] = None,
+        with_total: bool = False,
     ) -> Dict[str, Any]:
         """Return paginated movies payload with optional filters.
 
+        By default the expensive filtered COUNT is skipped: one extra row
+        is fetched to derive ``has_next`` and ``total_items`` is None.
+        Pass ``with_total=True`` to opt back into the exact count. When
+        ``after_id`` is given, the page is fetched with a keyset scan
+        (``WHERE id > after_id ORDER BY id LIMIT n``) instead;
+        ``next_cursor`` carries the id to resume from.
+
         Args:
-            page (int): page number.
+            page (int): page number (offset mode).
             page_size (int): items per page.
             title (Optional[str]): partial title to search.
             release_year (Optional[int]): filter by release year.
             genre (Optional[str]): filter by genre name.
+            after_id (Optional[int]): keyset cursor; last seen movie id.
+            with_total (bool): compute the exact ``total_items`` count.
 
         Returns:
             Dict[str, Any]: pagination-compatible movie payload.
@@ -130,15 +215,430 @@ class MovieService(BaseService):
         self._validate_pagination(page_size)
         if release_year is not None:
             self._validate_release_year(release_year)
+        title, genre = self._normalize_filters(title, genre)
+
+        cache_key = (
+            self._list_cache_version,
+            page,
+            page_size,
+            title,
+            release_year,
+            genre,
+            after_id,
+            with_total,
+        )
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        payload = await self._load_movies_page(
+            page,
+            page_size,
+            title=title,
+            release_year=release_year,
+            genre=genre,
+            after_id=after_id,
+            with_total=with_total,
+        )
+
+        if len(self._list_cache) >= self._LIST_CACHE_MAX:
+            self._list_cache.clear()
+        self._list_cache[cache_key] = (time.monotonic() + self._LIST_CACHE_TTL, payload)
+        return payload
+
+    async def get_movies_list_bytes(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        after_id: Optional[int] = None,
+        with_total: bool = False,
+    ) -> "tuple[bytes, Dict[str, Any]]":
+        """Return the fully encoded list response body and its payload.
+
+        The response shape is fixed, so the encoded bytes are cached
+        alongside the payload: repeat hits within the TTL skip the
+        serializer entirely and the route hands the body straight to a
+        Response. The payload dict rides along for logging.
+
+        Args:
+            page (int): page number (offset mode).
+            page_size (int): items per page.
+            title (Optional[str]): partial title to search.
+            release_year (Optional[int]): filter by release year.
+            genre (Optional[str]): filter by genre name.
+            after_id (Optional[int]): keyset cursor; last seen movie id.
+            with_total (bool): compute the exact ``total_items`` count.
+
+        Returns:
+            tuple[bytes, Dict[str, Any]]: orjson-encoded
+                ``{"status": "success", "data": ...}`` and the payload.
+
+        Raises:
+            ValidationError: when pagination or release_year args are invalid.
+        """
+        title, genre = self._normalize_filters(title, genre)
+        cache_key = (
+            "bytes",
+            self._list_cache_version,
+            page,
+            page_size,
+            title,
+            release_year,
+            genre,
+            after_id,
+            with_total,
+        )
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        payload = await self.get_movies_paginated(
+            page=page,
+            page_size=page_size,
+            title=title,
+            release_year=release_year,
+            genre=genre,
+            after_id=after_id,
+            with_total=with_total,
+        )
+        body = orjson.dumps({"status": "success", "data": payload})
+
+        if len(self._list_cache) >= self._LIST_CACHE_MAX:
+            self._list_cache.clear()
+        self._list_cache[cache_key] = (
+            time.monotonic() + self._LIST_CACHE_TTL,
+            (body, payload),
+        )
+        return body, payload
+
+    @staticmethod
+    def _encode_cursor(last_id: int) -> str:
+        """Encode the last seen movie id as an opaque cursor string.
+
+        Args:
+            last_id (int): id of the last row on the page.
+
+        Returns:
+            str: url-safe base64 cursor.
+
+        Raises:
+            None: pure encoder.
+        """
+        return base64.urlsafe_b64encode(str(last_id).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
+        """Decode an opaque cursor back into the last seen movie id.
+
+        Args:
+            cursor (str): cursor produced by ``_encode_cursor``.
+
+        Returns:
+            int: last seen movie id.
+
+        Raises:
+            ValidationError: when the cursor is malformed.
+        """
+        try:
+            return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, binascii.Error):
+            raise ValidationError("Invalid cursor")
+
+    async def get_movies_keyset(
+        self,
+        cursor: Optional[str],
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return one keyset page of movies starting after ``cursor``.
+
+        Seek pagination: O(log N + n) index scan regardless of depth, no
+        COUNT. One extra row is fetched to derive ``has_more``, and
+        ``next_cursor`` in the payload resumes the scan.
+
+        Args:
+            cursor (Optional[str]): opaque cursor from a previous page;
+                None starts from the beginning.
+            page_size (int): items per page.
+            title (Optional[str]): partial title to search.
+            release_year (Optional[int]): filter by release year.
+            genre (Optional[str]): filter by genre name.
+
+        Returns:
+            Dict[str, Any]: movie payload with ``has_more``/``next_cursor``.
+
+        Raises:
+            ValidationError: when pagination, release_year or cursor args
+                are invalid.
+        """
+        self._validate_pagination(page_size)
+        if release_year is not None:
+            self._validate_release_year(release_year)
+        title, genre = self._normalize_filters(title, genre)
+        after_id = self._decode_cursor(cursor) if cursor else 0
+
+        cache_key = (
+            "keyset",
+            self._list_cache_version,
+            after_id,
+            page_size,
+            title,
+            release_year,
+            genre,
+        )
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
-        items_raw, total_items = self._repo.list_paginated(
-            page, page_size, title=title, release_year=release_year, genre=genre
+        rows = await self._repo.list_keyset(
+            after_id, page_size + 1, title=title, release_year=release_year, genre=genre
         )
-        items: List[Dict[str, Any]] = [self._format_output(i, detail=False) for i in items_raw]
+        has_more = len(rows) > page_size
+        items = format_movie_page(rows[:page_size])
+        payload = {
+            "page": 1,
+            "page_size": page_size,
+            "total_items": None,
+            "items": items,
+            "has_more": has_more,
+            "next_cursor": self._encode_cursor(items[-1].id) if has_more else None,
+        }
+
+        if len(self._list_cache) >= self._LIST_CACHE_MAX:
+            self._list_cache.clear()
+        self._list_cache[cache_key] = (time.monotonic() + self._LIST_CACHE_TTL, payload)
+        return payload
+
+    async def _load_movies_page(
+        self,
+        page: int,
+        page_size: int,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        after_id: Optional[int] = None,
+        with_total: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch and format one movies page from the repository.
+
+        Args:
+            page (int): page number (offset mode).
+            page_size (int): items per page.
+            title (Optional[str]): partial title to search.
+            release_year (Optional[int]): filter by release year.
+            genre (Optional[str]): filter by genre name.
+            after_id (Optional[int]): keyset cursor; last seen movie id.
+            with_total (bool): compute the exact ``total_items`` count.
+
+        Returns:
+            Dict[str, Any]: pagination-compatible movie payload.
+
+        Raises:
+            Exception: when repository access fails.
+        """
+        if after_id is not None:
+            # over-fetch one row, like the cursor path: next_cursor only
+            # when more rows actually exist, not on an exact page boundary
+            rows = await self._repo.list_keyset(
+                after_id, page_size + 1, title=title, release_year=release_year, genre=genre
+            )
+            has_more = len(rows) > page_size
+            items = format_movie_page(rows[:page_size])
+            return {
+                "page": page,
+                "page_size": page_size,
+                "total_items": None,
+                "items": items,
+                "next_cursor": self._encode_cursor(items[-1].id) if has_more else None,
+            }
+
+        if not with_total:
+            # over-fetch one row: has_next without the second COUNT scan
+            rows = await self._repo.list_page(
+                page,
+                page_size,
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                limit=page_size + 1,
+            )
+            has_next = len(rows) > page_size
+            return {
+                "page": page,
+                "page_size": page_size,
+                "total_items": None,
+                "items": format_movie_page(rows[:page_size]),
+                "has_next": has_next,
+            }
+
+        filters_key = (title, release_year, genre)
+        cached_count = self._count_cache.get(filters_key)
+        if cached_count is not None and cached_count[1] > time.monotonic():
+            total_items = cached_count[0]
+            if (page - 1) * page_size >= total_items:
+                # cheap reject: the requested page is past the end
+                return {
+                    "page": page,
+                    "page_size": page_size,
+                    "total_items": total_items,
+                    "items": [],
+                }
+            items_raw = await self._repo.list_page(
+                page, page_size, title=title, release_year=release_year, genre=genre
+            )
+        else:
+            items_raw, total_items = await self._repo.list_paginated(
+                page, page_size, title=title, release_year=release_year, genre=genre
+            )
+            self._count_cache[filters_key] = (total_items, time.monotonic() + self._COUNT_CACHE_TTL)
+
+        items: List[Dict[str, Any]] = format_movie_page(items_raw)
 
         return {"page": page, "page_size": page_size, "total_items": total_items, "items": items}
 
-    def get_movie_detail(self, movie_id: int) -> Dict[str, Any]:
+    def invalidate_list_cache(self) -> None:
+        """Drop all cached list pages after a catalog mutation.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: simple cache bump.
+        """
+        self._list_cache_version += 1
+        self._list_cache.clear()
+
+    def invalidate_count_cache(self) -> None:
+        """Drop cached filtered totals after a catalog mutation.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: simple cache clear.
+        """
+        self._count_cache.clear()
+
+    def invalidate_detail_cache(self, movie_id: int) -> None:
+        """Drop the cached detail payload for one movie.
+
+        Args:
+            movie_id (int): movie id.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: safe no-op on cache miss.
+        """
+        self._detail_cache.pop(movie_id, None)
+
+    def on_ratings_changed(self, movie_ids: List[int]) -> None:
+        """Bust caches whose payloads embed rating aggregates.
+
+        Called by the rating write path after a successful insert batch;
+        list pages show average_rating/ratings_count, so they go stale
+        along with the touched movies' detail payloads.
+
+        Args:
+            movie_ids (List[int]): ids of movies that received ratings.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: simple cache maintenance.
+        """
+        self.invalidate_list_cache()
+        for movie_id in movie_ids:
+            self.invalidate_detail_cache(movie_id)
+
+    async def _valid_genre_ids(self) -> frozenset:
+        """Return the cached set of existing genre ids.
+
+        Genres are static reference data, so the set is loaded once and
+        refreshed on a short TTL instead of queried per movie write.
+
+        Returns:
+            frozenset: ids of every genre row.
+
+        Raises:
+            Exception: when repository access fails.
+        """
+        if self._genre_ids is None or self._genre_ids_expiry <= time.monotonic():
+            self._genre_ids = frozenset(await self._repo.all_genre_ids())
+            self._genre_ids_expiry = time.monotonic() + self._REF_CACHE_TTL
+        return self._genre_ids
+
+    async def _director_exists(self, director_id: int) -> bool:
+        """Check director existence through a bounded TTL cache.
+
+        Only positive answers are cached: a missing director may be
+        created at any moment, so misses always re-probe.
+
+        Args:
+            director_id (int): director id.
+
+        Returns:
+            bool: existence flag.
+
+        Raises:
+            Exception: when repository access fails.
+        """
+        expiry = self._director_cache.get(director_id)
+        if expiry is not None and expiry > time.monotonic():
+            return True
+        exists = await self._repo.exists_director(director_id)
+        if exists:
+            if len(self._director_cache) >= self._DIRECTOR_CACHE_MAX:
+                self._director_cache.clear()
+            self._director_cache[director_id] = time.monotonic() + self._REF_CACHE_TTL
+        return exists
+
+    async def _check_genres(self, genre_ids: List[int]) -> None:
+        """Validate that every given genre id exists, naming any misses.
+
+        The cached set answers the common case without a query; ids it
+        would reject are confirmed against the database first so a genre
+        added inside the TTL window is not falsely refused.
+
+        Args:
+            genre_ids (List[int]): genre ids to validate.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            ValidationError: naming the unknown genre ids.
+        """
+        missing = set(genre_ids) - await self._valid_genre_ids()
+        if not missing:
+            return
+        missing = await self._repo.missing_genre_ids(sorted(missing))
+        if missing:
+            raise ValidationError(f"Unknown genres: {sorted(missing)}")
+        # the cached set was stale; force a reload on the next check
+        self._genre_ids_expiry = 0.0
+
+    def invalidate_reference_caches(self) -> None:
+        """Drop the cached genre-id set and director existence entries.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: simple cache clear.
+        """
+        self._genre_ids = None
+        self._genre_ids_expiry = 0.0
+        self._director_cache.clear()
+
+    async def get_movie_detail(self, movie_id: int) -> Dict[str, Any]:
         """Return detailed movie payload.
 
         Args:
@@ -150,12 +650,38 @@ class MovieService(BaseService):
         Raises:
             NotFoundError: when movie not found.
         """
-        raw = self._repo.get_by_id(movie_id)
-        if raw is None:
-            raise NotFoundError("Movie not found")
-        return self._format_output(raw, detail=True)
-
-    def create_movie(
+        cached = self._detail_cache.get(movie_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self._detail_cache.move_to_end(movie_id)
+            return cached[1]
+
+        # single-flight: concurrent misses for the same id share one query
+        inflight = self._inflight_details.get(movie_id)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight_details[movie_id] = future
+        try:
+            raw = await self._repo.get_by_id(movie_id)
+            if raw is None:
+                raise NotFoundError("Movie not found")
+            payload = format_movie_detail(raw)
+
+            while len(self._detail_cache) >= self._DETAIL_CACHE_MAX:
+                self._detail_cache.popitem(last=False)
+            self._detail_cache[movie_id] = (time.monotonic() + self._DETAIL_CACHE_TTL, payload)
+            future.set_result(payload)
+            return payload
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                future.exception()  # mark retrieved for awaiter-less failures
+            raise
+        finally:
+            self._inflight_details.pop(movie_id, None)
+
+    async def create_movie(
         self,
         title: str,
         director_id: int,
@@ -180,19 +706,22 @@ class MovieService(BaseService):
         """
         self._validate_release_year(release_year)
 
-        if not self._repo.exists_director(director_id):
+        await self._check_genres(genre_ids)
+        if not await self._director_exists(director_id):
             raise ValidationError("Invalid director_id or genres")
 
-        matched = self._repo.count_genres_by_ids(genre_ids)
-        if matched != len(genre_ids):
-            raise ValidationError("Invalid director_id or genres")
-
-        raw = self._repo.create_movie(
+        raw = await self._repo.create_movie(
             title=title, director_id=director_id, release_year=release_year, cast=cast, genre_ids=genre_ids
         )
-        return self._format_output(raw, detail=True)
+        if raw is None:
+            # FK violation inside the insert transaction: a cached
+            # reference was deleted since the pre-check
+            raise ValidationError("Invalid director_id or genres")
+        self.invalidate_list_cache()
+        self.invalidate_count_cache()
+        return format_movie_detail(raw)
 
-    def update_movie(
+    async def update_movie(
         self,
         movie_id: int,
         title: str,
@@ -204,11 +733,9 @@ class MovieService(BaseService):
 
         self._validate_release_year(release_year)
 
-        matched = self._repo.count_genres_by_ids(genre_ids)
-        if matched != len(genre_ids):
-            raise ValidationError("Invalid director_id or genres")
+        await self._check_genres(genre_ids)
 
-        raw = self._repo.update_movie(
+        raw = await self._repo.update_movie(
             movie_id=movie_id,
             title=title,
             release_year=release_year,
@@ -218,12 +745,18 @@ class MovieService(BaseService):
         if raw is None:
             raise NotFoundError("Movie not found")
 
-        out = self._format_output(raw, detail=True)
-        out["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        self.invalidate_list_cache()
+        self.invalidate_count_cache()
+        self.invalidate_detail_cache(movie_id)
+        out = format_movie_detail(raw)
+        out["updated_at"] = _utc_now_iso()
         return out
 
-    def delete_movie(self, movie_id: int) -> None:
+    async def delete_movie(self, movie_id: int) -> None:
         """Delete movie or raise NotFoundError."""
-        ok = self._repo.delete_movie(movie_id)
+        ok = await self._repo.delete_movie(movie_id)
         if not ok:
             raise NotFoundError("Movie not found")
+        self.invalidate_list_cache()
+        self.invalidate_count_cache()
+        self.invalidate_detail_cache(movie_id)
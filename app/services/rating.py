@@ -1,24 +1,147 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import os
+
 from app.exceptions.exceptions import NotFoundError, ValidationError
+from app.services.base import BaseService
+
+# one hash probe instead of isinstance plus two comparisons per rating
+_VALID_SCORES = frozenset(range(1, 11))
+
+class RatingService(BaseService):
+    """Business logic for route 7 (post rating).
+
+    Concurrent POSTs are coalesced through an asyncio queue: a background
+    flusher drains up to RATING_BATCH_MAX entries (or whatever arrives
+    within RATING_BATCH_WINDOW_MS) and writes them with one multi-row
+    INSERT and one commit, then resolves the per-request futures.
+    """
+
+    def __init__(self, repo: Any, on_change: Optional[Callable[[List[int]], None]] = None) -> None:
+        super().__init__(repo)
+        self._on_change = on_change
+        # read at construction, not class definition: the lifespan builds
+        # this service after load_dotenv(), so .env overrides apply
+        self._max_batch = int(os.getenv("RATING_BATCH_MAX", "64"))
+        self._batch_window = float(os.getenv("RATING_BATCH_WINDOW_MS", "5")) / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background batch flusher.
+
+        Returns:
+            None: nothing.
+
+        Raises:
+            None: idempotent.
+        """
+        if self._flusher_task is None:
+            self._queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flusher())
 
-class RatingService:
-    """Business logic for route 7 (post rating)."""
+    async def stop(self) -> None:
+        """Cancel the flusher and fail any queued requests.
 
-    def __init__(self, repo: Any) -> None:
-        self._repo = repo
+        Returns:
+            None: nothing.
 
-    def add_rating(self, movie_id: int, score: int) -> Dict[str, Any]:
-        if not isinstance(score, int) or score < 1 or score > 10:
+        Raises:
+            None: safe no-op if not started.
+        """
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+            queue, self._queue = self._queue, None
+            # fail whatever never reached the flusher so awaiting POSTs
+            # error out instead of hanging until the kill timeout
+            if queue is not None:
+                shutdown = RuntimeError("Rating service is shutting down")
+                while not queue.empty():
+                    _, _, future = queue.get_nowait()
+                    if not future.done():
+                        future.set_exception(shutdown)
+
+    async def add_rating(self, movie_id: int, score: int) -> Dict[str, Any]:
+        if score not in _VALID_SCORES:
             raise ValidationError("Score must be an integer between 1 and 10")
 
-        rating = self._repo.add_rating(movie_id, score)
+        if self._queue is not None:
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            await self._queue.put((movie_id, score, future))
+            rating = await future
+        else:
+            # flusher not running (e.g. direct service use): write through
+            results = await self._repo.add_ratings_batch([(movie_id, score)])
+            rating = results[0]
+            if rating is not None and self._on_change is not None:
+                self._on_change([movie_id])
+
         if rating is None:
             raise NotFoundError("Movie not found")
 
-        created_at = rating.rated_at.isoformat() if rating.rated_at is not None else None
+        rated_at = rating["rated_at"]
         return {
-            "rating_id": rating.id,
-            "movie_id": rating.movie_id,
-            "score": rating.score,
-            "created_at": created_at,
+            "rating_id": rating["id"],
+            "movie_id": rating["movie_id"],
+            "score": rating["score"],
+            "created_at": rated_at.isoformat() if rated_at is not None else None,
         }
+
+    async def _flusher(self) -> None:
+        """Drain the queue in micro-batches and resolve futures.
+
+        Returns:
+            None: runs until cancelled.
+
+        Raises:
+            asyncio.CancelledError: on shutdown.
+        """
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[int, int, asyncio.Future]] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self._batch_window
+                while len(batch) < self._max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    results = await self._repo.add_ratings_batch(
+                        [(movie_id, score) for movie_id, score, _ in batch]
+                    )
+                except Exception as ex:  # fail the whole batch, keep flushing
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(ex)
+                    continue
+            except asyncio.CancelledError:
+                # shutdown landed mid-drain: fail the collected batch so
+                # its awaiters do not hang; stop() drains the rest
+                shutdown = RuntimeError("Rating service is shutting down")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(shutdown)
+                raise
+
+            if self._on_change is not None:
+                changed = [
+                    result["movie_id"] for result in results if result is not None
+                ]
+                if changed:
+                    self._on_change(changed)
+
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)